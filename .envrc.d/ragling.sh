@@ -4,10 +4,23 @@ if [[ ! -f "$PWD/opt/local-rag/pyproject.toml" ]]; then
     git submodule update --init opt/local-rag
 fi
 
-# Apply Zig tree-sitter support patch if not already applied.
-if ! grep -q '".zig"' "$PWD/opt/local-rag/src/ragling/parsers/code.py" 2>/dev/null; then
-    echo "direnv: applying Zig support patch to local-rag..."
-    git -C "$PWD/opt/local-rag" am "$PWD/patches/0001-feat-add-Zig-tree-sitter-support-for-code-indexing.patch"
+# Apply the local-rag patch series in order (see patches/README.md).
+# A patch counts as applied when local-rag has a commit with its subject.
+# A patch that does not apply is skipped and the rest are still tried.
+_failed=()
+for _patch in "$PWD"/patches/[0-9][0-9][0-9][0-9]-*.patch; do
+    _subject=$(git mailinfo /dev/null /dev/null <"$_patch" | sed -n 's/^Subject: //p')
+    if ! git -C "$PWD/opt/local-rag" log --format=%s | grep -qxF "$_subject"; then
+        echo "direnv: applying $(basename "$_patch") to local-rag..."
+        if ! git -C "$PWD/opt/local-rag" am "$_patch"; then
+            git -C "$PWD/opt/local-rag" am --abort
+            echo "direnv: $(basename "$_patch") did not apply; skipped" >&2
+            _failed+=("$(basename "$_patch")")
+        fi
+    fi
+done
+if (( ${#_failed[@]} )); then
+    echo "direnv: local-rag patches not applied: ${_failed[*]}" >&2
 fi
 
 # Create stable symlinks for ragling indexing.